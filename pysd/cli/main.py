@@ -28,7 +28,8 @@ def main(args):
 
     model = load(options.model_file, options.data_files,
                  options.missing_values, options.split_views,
-                 subview_sep=options.subview_sep)
+                 subview_sep=options.subview_sep,
+                 use_cache=options.use_cache)
 
     if not options.run:
         print("\nFinished!")
@@ -277,6 +277,13 @@ trans_arguments.add_argument(
     help='parse the sketch to detect model elements in each model view,'
          ' and then translate each view in a separate Python file')
 
+trans_arguments.add_argument(
+    '--use-cache', dest='use_cache',
+    action='store_true', default=False,
+    help='reuse the generated model file cached from a previous'
+         ' translation of an identical model source, only available for'
+         ' Vensim models without macros and without --split-views')
+
 trans_arguments.add_argument(
     '--subview-sep', dest='subview_sep',
     action='store', type=split_subview_sep, default=[],
@@ -119,6 +119,11 @@ def read_vensim(
             Characters used to separate views and subviews (e.g. [",", "."]).
             If provided, and split_views=True, each submodule will be placed
             inside the directory of the parent view.
+        use_cache: bool
+            If True, reuse the generated model file cached from a
+            previous translation of an identical model source, skipping
+            the translation. Only available for models without macros
+            and with split_views=False. Default is False.
 
 
     Returns
@@ -235,13 +235,13 @@ def assert_frames_close(actual, expected, assertion="raise",
 
 def assert_allclose(x, y, rtol=1.e-5, atol=1.e-5):
     """
-    Asserts if all numeric values from two arrays are close.
+    Asserts if all numeric values from two frames are close.
 
     Parameters
     ----------
-    x: ndarray
+    x: pandas.DataFrame
         Expected value.
-    y: ndarray
+    y: pandas.DataFrame
         Actual value.
     rtol: float (optional)
         Relative tolerance on the error. Default is 1.e-5.
@@ -250,15 +250,23 @@ def assert_allclose(x, y, rtol=1.e-5, atol=1.e-5):
 
     Returns
     -------
-    None
+    pandas.Series
+        Whether all values of each column are close.
 
     """
-    return ((abs(x - y) <= atol + rtol * abs(y)) + x.isna()*y.isna()).all()
+    # compare on the underlying arrays in a single vectorized pass,
+    # avoiding the per-column pandas alignment and intermediate frames
+    x_values = x.to_numpy(dtype=float)
+    y_values = y.to_numpy(dtype=float)
+    close = (np.abs(x_values - y_values) <= atol + rtol * np.abs(y_values))\
+        | (np.isnan(x_values) & np.isnan(y_values))
+    return pd.Series(close.all(axis=0), index=x.columns)
 
 
 def _remove_constant_nan(df):
     """
     Removes nana values in constant value columns produced by Vensim
     """
-    nan_cols = np.isnan(df.iloc[1:, :]).all()
-    df.loc[:, nan_cols] = df.loc[:, nan_cols].iloc[0].values
+    nan_cols = np.isnan(df.to_numpy(dtype=float)[1:]).all(axis=0)
+    if nan_cols.any():
+        df.loc[:, nan_cols] = df.loc[:, nan_cols].iloc[0].values
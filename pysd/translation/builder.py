@@ -13,7 +13,9 @@ import re
 import os.path
 import textwrap
 import warnings
-from io import open
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from sys import intern
 import black
 import json
 
@@ -32,6 +34,12 @@ class Imports():
     _external_libs = {"numpy": "np", "xarray": "xr"}
     _internal_libs = [
         "functions", "statefuls", "external", "data", "utils"]
+    # name -> set dispatch used by the hot add() path, avoiding a getattr
+    # with a freshly built attribute name per call. reset() clears these
+    # sets in place so the mapping never goes stale
+    _internal_sets = {
+        "functions": _functions, "statefuls": _statefuls,
+        "external": _external, "data": _data, "utils": _utils}
 
     @classmethod
     def add(cls, module, function=None):
@@ -48,7 +56,7 @@ class Imports():
 
         """
         if function:
-            getattr(cls, f"_{module}").add(function)
+            cls._internal_sets[module].add(function)
         else:
             setattr(cls, f"_{module}", True)
 
@@ -99,13 +107,186 @@ class Imports():
         Reset the imported modules
         """
         cls._numpy, cls._xarray, cls._subs = False, False, False
-        cls._functions, cls._statefuls, cls._external, cls._data,\
-            cls._utils = set(), set(), set(), set(), set()
+        # clear in place so the sets cached in _internal_sets stay valid
+        for internal_set in cls._internal_sets.values():
+            internal_set.clear()
+
+    @classmethod
+    def get_state(cls):
+        """
+        Return the current imported modules information. Used to pass the
+        imports added in a worker process back to the parent process.
+        """
+        return {
+            "numpy": cls._numpy, "xarray": cls._xarray, "subs": cls._subs,
+            "functions": set(cls._functions),
+            "statefuls": set(cls._statefuls),
+            "external": set(cls._external),
+            "data": set(cls._data),
+            "utils": set(cls._utils)}
+
+    @classmethod
+    def merge_state(cls, state):
+        """
+        Merge the imported modules information returned by get_state.
+        """
+        cls._numpy = cls._numpy or state["numpy"]
+        cls._xarray = cls._xarray or state["xarray"]
+        cls._subs = cls._subs or state["subs"]
+        for module in cls._internal_libs:
+            cls._internal_sets[module].update(state[module])
 
 
 # Variable to save identifiers of external objects
 build_names = set()
 
+# interned literals shared by every element dict the builders emit, so
+# equal values point to a single string object
+_NONE = intern("None")
+_EMPTY = intern("")
+_KIND_STATEFUL = intern("stateful")
+_KIND_EXTERNAL = intern("external")
+_KIND_EXTERNAL_ADD = intern("external_add")
+
+# black.FileMode is not trivial to construct, build it once and reuse it
+# for every formatted file
+_black_mode = black.FileMode()
+
+# minimum number of elements to build them in parallel processes
+_parallel_threshold = 64
+
+# The templates below are constant: dedent them once at import time so
+# the builders do not re-run textwrap.dedent and re-parse %-format specs
+# for every built element. They are filled with str.format_map.
+
+_model_template = textwrap.dedent("""
+    __pysd_version__ = '{version}'
+
+    __data = {{
+        'scope': None,
+        'time': lambda: 0
+    }}
+
+    _root = Path(__file__).parent
+
+    _subscript_dict = {subscript_dict}
+
+    _namespace = {namespace}
+
+    _dependencies = {dependencies}
+    """)
+
+_main_module_template = textwrap.dedent("""
+    __pysd_version__ = '{version}'
+
+    __data = {{
+        'scope': None,
+        'time': lambda: 0
+    }}
+
+    _root = Path(__file__).parent
+
+    _namespace, _subscript_dict, _dependencies, _modules = load_model_data(
+        _root, "{outfile}")
+    """)
+
+_load_modules_template = textwrap.dedent("""
+    # load modules from modules_{outfile} directory
+    exec(load_modules("modules_{outfile}", _modules, _root, []))
+
+    """)
+
+_module_header_template = textwrap.dedent('''
+    """
+    Module {module_name}
+    Translated using PySD version {version}
+    """
+    ''')
+
+_control_vars_dict_template = textwrap.dedent("""
+    _control_vars = {{
+        "initial_time": lambda: {initial_time},
+        "final_time": lambda: {final_time},
+        "time_step": lambda: {time_step},
+        "saveper": lambda: {saveper}
+    }}
+    """)
+
+_control_vars_template = textwrap.dedent("""
+    ##########################################################################
+    #                            CONTROL VARIABLES                           #
+    ##########################################################################
+    {control_vars_dict}
+    def _init_outer_references(data):
+        for key in data:
+            __data[key] = data[key]
+
+
+    def time():
+        return __data['time']()
+
+    """)
+
+_model_vars_header = textwrap.dedent("""
+    ##########################################################################
+    #                             MODEL VARIABLES                            #
+    ##########################################################################
+    """)
+
+_stateful_element_template = textwrap.dedent("""
+    {py_name} = {py_expr}
+    """)
+
+_external_add_template = textwrap.dedent("""
+    {py_name}{py_expr}
+    """)
+
+# stateful object construction templates, built once per add_* builder
+# instead of inside each call
+_ext_lookup_add_template = ".add(%s, %s, %s, %s, %s)"
+_integ_template = "Integ(lambda: %s, lambda: %s, '%s')"
+_integ_subs_template = "Integ(_integ_input_%s, _integ_init_%s, '%s')"
+_delay_template = ("Delay(lambda: %s, lambda: %s,"
+                   "lambda: %s, lambda: %s, time_step, '%s')")
+_delay_subs_template = ("Delay(_delay_input_%s, lambda: %s, _delay_init_%s,"
+                        "lambda: %s, time_step, '%s')")
+_delay_fixed_template = ("DelayFixed(lambda: %s, lambda: %s,"
+                         "lambda: %s, time_step, '%s')")
+_delay_n_template = ("DelayN(lambda: %s, lambda: %s,"
+                     "lambda: %s, lambda: %s, time_step, '%s')")
+_delay_n_subs_template = ("DelayN(_delayn_input_%s, lambda: %s,"
+                          " _delayn_init_%s, lambda: %s, time_step, '%s')")
+_forecast_template = "Forecast(lambda: %s, lambda: %s, lambda: %s, '%s')"
+_forecast_subs_template = ("Forecast(_forecast_input_%s, lambda: %s,"
+                           " lambda: %s, '%s')")
+_sample_if_true_template = ("SampleIfTrue(lambda: %s, lambda: %s,"
+                            "lambda: %s, '%s')")
+_sample_if_true_subs_template = ("SampleIfTrue(lambda: %s, lambda: %s,"
+                                 "_sample_if_true_init_%s, '%s')")
+_smooth_template = ("Smooth(lambda: %s, lambda: %s,"
+                    "lambda: %s, lambda: %s, '%s')")
+_smooth_subs_template = ("Smooth(_smooth_input_%s, lambda: %s,"
+                         " _smooth_init_%s, lambda: %s, '%s')")
+_trend_template = "Trend(lambda: %s, lambda: %s, lambda: %s, '%s')"
+_trend_subs_template = "Trend(lambda: %s, lambda: %s, _trend_init_%s, '%s')"
+_initial_template = "Initial(lambda: %s, '%s')"
+
+_component_template = textwrap.dedent('''
+    {subs_dec}
+    def {py_name}({arguments}):
+        """
+        Real Name: {real_name}
+        Original Eqn: {eqn}
+        Units: {unit}
+        Limits: {lims}
+        Type: {kind}
+        Subs: {subs_doc}
+
+        {doc}
+        """
+        {contents}
+    ''')
+
 
 def build_modular_model(elements, subscript_dict, namespace, dependencies,
                         main_filename, elements_per_view):
@@ -261,41 +442,24 @@ def _build_main_module(elements, subscript_dict, file_name):
     text = Imports.get_header(os.path.basename(file_name))
 
     # import namespace from json file
-    text += textwrap.dedent("""
-    __pysd_version__ = '%(version)s'
-
-    __data = {
-        'scope': None,
-        'time': lambda: 0
-    }
-
-    _root = Path(__file__).parent
-
-    _namespace, _subscript_dict, _dependencies, _modules = load_model_data(
-        _root, "%(outfile)s")
-    """ % {
+    text += _main_module_template.format_map({
         "outfile": os.path.basename(file_name).split(".")[0],
         "version": __version__
     })
 
     text += _get_control_vars(control_vars)
 
-    text += textwrap.dedent("""
-        # load modules from modules_%(outfile)s directory
-        exec(load_modules("modules_%(outfile)s", _modules, _root, []))
-
-        """ % {
-            "outfile": os.path.basename(file_name).split(".")[0],
-        })
+    text += _load_modules_template.format_map({
+        "outfile": os.path.basename(file_name).split(".")[0],
+    })
 
     text += funcs
-    text = black.format_file_contents(text, fast=True, mode=black.FileMode())
+    text = black.format_file_contents(text, fast=True, mode=_black_mode)
 
     # Needed for various sessions
     build_names.clear()
 
-    with open(file_name, "w", encoding="UTF-8") as out:
-        out.write(text)
+    Path(file_name).write_text(text, encoding="UTF-8")
 
 
 def _build_separate_module(elements, subscript_dict, module_name, module_dir):
@@ -328,26 +492,21 @@ def _build_separate_module(elements, subscript_dict, module_name, module_dir):
     None
 
     """
-    text = textwrap.dedent('''
-    """
-    Module %(module_name)s
-    Translated using PySD version %(version)s
-    """
-    ''' % {
+    text = _module_header_template.format_map({
         "module_name": module_name,
         "version": __version__,
     })
     funcs = _generate_functions(elements, subscript_dict)
     text += funcs
-    text = black.format_file_contents(text, fast=True, mode=black.FileMode())
+    text = black.format_file_contents(text, fast=True, mode=_black_mode)
 
     outfile_name = os.path.join(module_dir, module_name + ".py")
 
-    with open(outfile_name, "w", encoding="UTF-8") as out:
-        out.write(text)
+    Path(outfile_name).write_text(text, encoding="UTF-8")
 
 
-def build(elements, subscript_dict, namespace, dependencies, outfile_name):
+def build(elements, subscript_dict, namespace, dependencies, outfile_name,
+          format=True):
     """
     Constructs and writes the python representation of the model, when the
     the split_modules is set to False in the read_vensim function. The entire
@@ -378,6 +537,12 @@ def build(elements, subscript_dict, namespace, dependencies, outfile_name):
     outfile_name: str
         The name of the file to write the model to.
 
+    format: bool (optional)
+        If True the generated code will be formatted with black. Formatting
+        is by far the slowest step when building large models and the
+        emitted code is already valid python, so it can be skipped when
+        translating in tight loops. Default is True.
+
     Returns
     -------
     None or text: None or str
@@ -388,32 +553,24 @@ def build(elements, subscript_dict, namespace, dependencies, outfile_name):
     # separating between control variables and rest of variables
     control_vars, funcs = _build_variables(elements, subscript_dict)
 
-    text = Imports.get_header(os.path.basename(outfile_name))
-
-    text += textwrap.dedent("""
-    __pysd_version__ = '%(version)s'
-
-    __data = {
-        'scope': None,
-        'time': lambda: 0
-    }
-
-    _root = Path(__file__).parent
-
-    _subscript_dict = %(subscript_dict)s
-
-    _namespace = %(namespace)s
+    # collect the fragments in a list and join them only once at the end,
+    # appending is linear while repeated concatenation is quadratic in the
+    # size of the generated file
+    parts = [Imports.get_header(os.path.basename(outfile_name))]
 
-    _dependencies = %(dependencies)s
-    """ % {
+    parts.append(_model_template.format_map({
         "subscript_dict": repr(subscript_dict),
         "namespace": repr(namespace),
         "dependencies": repr(dependencies),
         "version": __version__,
-    })
+    }))
+
+    parts.append(_get_control_vars(control_vars))
+    parts.append(funcs)
 
-    text += _get_control_vars(control_vars) + funcs
-    text = black.format_file_contents(text, fast=True, mode=black.FileMode())
+    text = "".join(parts)
+    if format:
+        text = black.format_file_contents(text, fast=True, mode=_black_mode)
 
     # Needed for various sessions
     build_names.clear()
@@ -422,8 +579,7 @@ def build(elements, subscript_dict, namespace, dependencies, outfile_name):
     if outfile_name == "return":
         return text
 
-    with open(outfile_name, "w", encoding="UTF-8") as out:
-        out.write(text)
+    Path(outfile_name).write_text(text, encoding="UTF-8")
 
 
 def _generate_functions(elements, subscript_dict):
@@ -453,15 +609,55 @@ def _generate_functions(elements, subscript_dict):
         String containing all formated model functions
 
     """
-    functions = [build_element(element, subscript_dict) for element in
-                 elements]
-
-    funcs = "%(functions)s" % {"functions": "\n".join(functions)}
-    funcs = funcs.replace("\t", "    ")
+    if len(elements) < _parallel_threshold:
+        # for small models the pool spin-up costs more than it saves
+        functions = [build_element(element, subscript_dict) for element in
+                     elements]
+    else:
+        # each element is built independently, only the imports information
+        # is shared, so the workers return it and it is merged sequentially
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(
+                _build_element_worker,
+                ((element, subscript_dict) for element in elements),
+                chunksize=max(
+                    1, len(elements)//((os.cpu_count() or 1)*4))))
+
+        functions = []
+        for func, imports_state in results:
+            functions.append(func)
+            Imports.merge_state(imports_state)
+
+    funcs = "\n".join(functions).replace("\t", "    ")
 
     return funcs
 
 
+def _build_element_worker(args):
+    """
+    Worker to call build_element in a separate process. Returns the built
+    function together with the imports information added while building it,
+    as the mutations of Imports made in the worker are not visible in the
+    parent process.
+
+    Parameters
+    ----------
+    args: tuple
+        Tuple with the element dictionary and the subscript_dict.
+
+    Returns
+    -------
+    func, imports_state: str, dict
+        The function to write in the model file and the state of Imports
+        after building it.
+
+    """
+    element, subscript_dict = args
+    Imports.reset()
+    func = build_element(element, subscript_dict)
+    return func, Imports.get_state()
+
+
 def _get_control_vars(control_vars):
     """
     Create the section of control variables
@@ -477,28 +673,12 @@ def _get_control_vars(control_vars):
         Control variables section and header of model variables section.
 
     """
-    text = textwrap.dedent("""
-    ##########################################################################
-    #                            CONTROL VARIABLES                           #
-    ##########################################################################
-    %(control_vars_dict)s
-    def _init_outer_references(data):
-        for key in data:
-            __data[key] = data[key]
-
-
-    def time():
-        return __data['time']()
-
-    """ % {"control_vars_dict": control_vars[0]})
+    text = _control_vars_template.format_map(
+        {"control_vars_dict": control_vars[0]})
 
     text += control_vars[1]
 
-    text += textwrap.dedent("""
-    ##########################################################################
-    #                             MODEL VARIABLES                            #
-    ##########################################################################
-    """)
+    text += _model_vars_header
 
     return text
 
@@ -548,14 +728,8 @@ def _build_variables(elements, subscript_dict):
         # macro objects, no control variables
         control_vars_dict = ""
     else:
-        control_vars_dict = """
-    _control_vars = {
-        "initial_time": lambda: %(initial_time)s,
-        "final_time": lambda: %(final_time)s,
-        "time_step": lambda: %(time_step)s,
-        "saveper": lambda: %(saveper)s
-    }
-    """ % control_vars_dict
+        control_vars_dict = _control_vars_dict_template.format_map(
+            control_vars_dict)
 
     return (control_vars_dict,
             _generate_functions(control_vars, subscript_dict)),\
@@ -590,24 +764,30 @@ def build_element(element, subscript_dict):
         The function to write in the model file.
 
     """
-    # check the elements with ADD in their name
-    # as these wones are directly added to the
-    # external objecets via .add method
-    py_expr_no_ADD = ["ADD" not in py_expr for py_expr in element["py_expr"]]
-
     if element["kind"] == "dependencies":
         # element only used to update dependencies
         return ""
-    elif sum(py_expr_no_ADD) > 1 and element["kind"] not in [
+
+    # elements with ADD in their name are directly added to the external
+    # objects via the .add method, they only need to be merged when more
+    # than one expression is left; the scan stops as soon as that is known
+    # and is skipped entirely for the common single expression case
+    merge = False
+    if len(element["py_expr"]) > 1 and element["kind"] not in [
         "stateful",
         "external",
         "external_add",
     ]:
+        no_ADD = 0
+        for py_expr in element["py_expr"]:
+            no_ADD += "ADD" not in py_expr
+            if no_ADD > 1:
+                merge = True
+                break
+
+    if merge:
         py_expr_i = []
-        # need to append true to the end as the next element is checked
-        py_expr_no_ADD.append(True)
-        for i, (py_expr, subs_i) in enumerate(zip(element["py_expr"],
-                                                  element["subs"])):
+        for py_expr, subs_i in zip(element["py_expr"], element["subs"]):
             if not (py_expr.startswith("xr.") or py_expr.startswith("_ext_")):
                 # rearrange if it doesn't come from external or xarray
                 coords = utils.make_coord_dict(
@@ -622,7 +802,7 @@ def build_element(element, subscript_dict):
                 Imports.add("utils", "rearrange")
                 py_expr_i.append("rearrange(%s, %s, %s)" % (
                     py_expr, dims, coords))
-            elif py_expr_no_ADD[i]:
+            elif "ADD" not in py_expr:
                 # element comes from external or xarray
                 py_expr_i.append(py_expr)
         Imports.add("utils", "xrmerge")
@@ -641,7 +821,7 @@ def build_element(element, subscript_dict):
         # this will give more information to the user and make possible
         # to rewrite subscripted values with model.run(params=X) or
         # model.run(initial_condition=(n,x))
-        element["subs_doc"] = "%s" % element["merge_subs"]
+        element["subs_doc"] = str(element["merge_subs"])
         if element["kind"] in ["component", "setup", "constant",
                                "component_ext_data", "data"]:
             # the decorator is not always necessary as the objects
@@ -653,39 +833,36 @@ def build_element(element, subscript_dict):
                 "@subs(%s, _subscript_dict)" % element["merge_subs"]
             Imports.add("subs")
 
-    indent = 8
+    # the templates are already dedented, indent lines 2 onward to their
+    # final level directly
+    indent = 4
     element.update(
         {
             "ulines": "-" * len(element["real_name"]),
             "contents": contents.replace("\n", "\n" + " " * indent),
         }
     )
-    # indent lines 2 onward
 
-    # convert newline indicator and add expected level of indentation
-    element["doc"] = element["doc"].replace("\\", "\n").replace("\n", "\n    ")
+    # convert newline indicator
+    element["doc"] = element["doc"].replace("\\", "\n")
 
     if element["kind"] in ["stateful", "external", "tab_data"]:
-        func = """
-    %(py_name)s = %(py_expr)s
-            """ % {
+        func = _stateful_element_template.format_map({
             "py_name": element["py_name"],
             "py_expr": element["py_expr"][0],
-        }
+        })
 
     elif element["kind"] == "external_add":
         # external expressions to be added with .add method
         # remove the ADD from the end
         py_name = element["py_name"].split("ADD")[0]
-        func = """
-    %(py_name)s%(py_expr)s
-            """ % {
+        func = _external_add_template.format_map({
             "py_name": py_name,
             "py_expr": element["py_expr"][0],
-        }
+        })
 
     else:
-        sep = "\n" + " " * 10
+        sep = "\n" + " " * 6
         if len(element["eqn"]) == 1:
             # Original equation in the same line
             element["eqn"] = element["eqn"][0]
@@ -699,26 +876,9 @@ def build_element(element, subscript_dict):
             # From 2 to 5 equations in different lines
             element["eqn"] = sep + sep.join(element["eqn"])
 
-        func = (
-            '''
-    %(subs_dec)s
-    def %(py_name)s(%(arguments)s):
-        """
-        Real Name: %(real_name)s
-        Original Eqn: %(eqn)s
-        Units: %(unit)s
-        Limits: %(lims)s
-        Type: %(kind)s
-        Subs: %(subs_doc)s
-
-        %(doc)s
-        """
-        %(contents)s
-        '''
-            % element
-        )
+        func = _component_template.format_map(element)
 
-    return textwrap.dedent(func)
+    return func
 
 
 def merge_partial_elements(element_list):
@@ -740,11 +900,14 @@ def merge_partial_elements(element_list):
     outs = dict()  # output data structure
 
     for element in element_list:
-        name = element["py_name"]
-        if name not in outs:
-            # Use 'expr' for Vensim models, and 'eqn' for Xmile
-            # (This makes the Vensim equation prettier.)
-            eqn = element["expr"] if "expr" in element else element["eqn"]
+        # partial elements share the py_name, intern it so the repeated
+        # lookups in outs compare by pointer and duplicates share memory
+        name = intern(element["py_name"])
+        # Use 'expr' for Vensim models, and 'eqn' for Xmile
+        # (This makes the Vensim equation prettier.)
+        eqn = element["expr"] if "expr" in element else element["eqn"]
+        cur = outs.get(name)
+        if cur is None:
             parent_name = element["parent_name"] if "parent_name" in element\
                 else None
             outs[name] = {
@@ -766,27 +929,28 @@ def merge_partial_elements(element_list):
             }
 
         else:
-            eqn = element["expr"] if "expr" in element else element["eqn"]
-
-            outs[name]["doc"] = outs[name]["doc"] or element["doc"]
-            outs[name]["unit"] = outs[name]["unit"] or element["unit"]
-            outs[name]["lims"] = outs[name]["lims"] or element["lims"]
-            outs[name]["eqn"] += [eqn.replace(r"\ ", "")]
-            outs[name]["py_expr"] += [element["py_expr"]]
-            outs[name]["subs"] += [element["subs"]]
-            if outs[name]["dependencies"] is not None:
+            # bind the output element once instead of looking it up
+            # for every updated entry
+            cur["doc"] = cur["doc"] or element["doc"]
+            cur["unit"] = cur["unit"] or element["unit"]
+            cur["lims"] = cur["lims"] or element["lims"]
+            cur["eqn"].append(eqn.replace(r"\ ", ""))
+            cur["py_expr"].append(element["py_expr"])
+            cur["subs"].append(element["subs"])
+            dependencies = cur["dependencies"]
+            if dependencies is not None:
                 if name.startswith("_"):
                     # stateful object merge initial and step
-                    for target in outs[name]["dependencies"]:
+                    for target in dependencies:
                         _merge_dependencies(
-                            outs[name]["dependencies"][target],
+                            dependencies[target],
                             element["dependencies"][target])
                 else:
                     # regular element
                     _merge_dependencies(
-                        outs[name]["dependencies"],
+                        dependencies,
                         element["dependencies"])
-            outs[name]["arguments"] = element["arguments"]
+            cur["arguments"] = element["arguments"]
 
     return list(outs.values())
 
@@ -867,11 +1031,11 @@ def build_active_initial_deps(identifier, arguments, deps):
         "unit": "",
         "lims": "",
         "eqn": "",
-        "subs": "",
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
         "kind": "dependencies",
-        "arguments": "",
+        "arguments": _EMPTY,
     }]
 
     return py_name, new_structure
@@ -930,13 +1094,13 @@ def add_stock(identifier, expression, initial_condition, subs, merge_subs,
     py_name = "_integ_%s" % identifier
 
     if len(subs) == 0:
-        stateful_py_expr = "Integ(lambda: %s, lambda: %s, '%s')" % (
+        stateful_py_expr = _integ_template % (
             expression,
             initial_condition,
             py_name,
         )
     else:
-        stateful_py_expr = "Integ(_integ_input_%s, _integ_init_%s, '%s')" % (
+        stateful_py_expr = _integ_subs_template % (
             identifier,
             identifier,
             py_name,
@@ -955,9 +1119,9 @@ def add_stock(identifier, expression, initial_condition, subs, merge_subs,
             "doc": "Provides initial conditions for %s function"
                     % identifier,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
-            "arguments": "",
+            "lims": _NONE,
+            "eqn": _NONE,
+            "arguments": _EMPTY,
         })
 
         new_structure.append({
@@ -969,10 +1133,10 @@ def add_stock(identifier, expression, initial_condition, subs, merge_subs,
             "subs": subs,
             "merge_subs": merge_subs,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
+            "lims": _NONE,
+            "eqn": _NONE,
             "py_expr": expression,
-            "arguments": "",
+            "arguments": _EMPTY,
         })
 
     # describe the stateful object
@@ -982,14 +1146,14 @@ def add_stock(identifier, expression, initial_condition, subs, merge_subs,
         "real_name": "Representation of  %s" % identifier,
         "doc": "Integrates Expression %s" % expression,
         "py_expr": stateful_py_expr,
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
-        "arguments": "",
+        "kind": _KIND_STATEFUL,
+        "arguments": _EMPTY,
     })
 
     return "%s()" % py_name, new_structure
@@ -1063,18 +1227,12 @@ def add_delay(identifier, delay_input, delay_time, initial_value, order,
     py_name = "_delay_%s" % identifier
 
     if len(subs) == 0:
-        stateful_py_expr = (
-            "Delay(lambda: %s, lambda: %s,"
-            "lambda: %s, lambda: %s, time_step, '%s')"
-            % (delay_input, delay_time, initial_value, order, py_name)
-        )
+        stateful_py_expr = _delay_template % (
+            delay_input, delay_time, initial_value, order, py_name)
 
     else:
-        stateful_py_expr = (
-            "Delay(_delay_input_%s, lambda: %s, _delay_init_%s,"
-            "lambda: %s, time_step, '%s')"
-            % (identifier, delay_time, identifier, order, py_name)
-        )
+        stateful_py_expr = _delay_subs_template % (
+            identifier, delay_time, identifier, order, py_name)
 
         # following elements not specified in the model file, but must exist
         # create the delay initialization element
@@ -1089,9 +1247,9 @@ def add_delay(identifier, delay_input, delay_time, initial_value, order,
             "doc": "Provides initial conditions for %s function" \
                     % identifier,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
-            "arguments": "",
+            "lims": _NONE,
+            "eqn": _NONE,
+            "arguments": _EMPTY,
         })
 
         new_structure.append({
@@ -1103,10 +1261,10 @@ def add_delay(identifier, delay_input, delay_time, initial_value, order,
             "subs": subs,
             "merge_subs": merge_subs,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
+            "lims": _NONE,
+            "eqn": _NONE,
             "py_expr": delay_input,
-            "arguments": "",
+            "arguments": _EMPTY,
         })
 
     # describe the stateful object
@@ -1117,14 +1275,14 @@ def add_delay(identifier, delay_input, delay_time, initial_value, order,
         "doc": "Delay time: %s \n Delay initial value %s \n Delay order %s"
         % (delay_time, initial_value, order),
         "py_expr": stateful_py_expr,
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
-        "arguments": "",
+        "kind": _KIND_STATEFUL,
+        "arguments": _EMPTY,
     })
 
     return "%s()" % py_name, new_structure
@@ -1182,11 +1340,8 @@ def add_delay_f(identifier, delay_input, delay_time, initial_value, deps):
 
     py_name = "_delayfixed_%s" % identifier
 
-    stateful_py_expr = (
-        "DelayFixed(lambda: %s, lambda: %s,"
-        "lambda: %s, time_step, '%s')"
-        % (delay_input, delay_time, initial_value, py_name)
-    )
+    stateful_py_expr = _delay_fixed_template % (
+        delay_input, delay_time, initial_value, py_name)
 
     # describe the stateful object
     stateful = {
@@ -1196,14 +1351,14 @@ def add_delay_f(identifier, delay_input, delay_time, initial_value, deps):
         "doc": "DelayFixed time: %s \n Delay initial value %s"
         % (delay_time, initial_value),
         "py_expr": stateful_py_expr,
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
-        "arguments": "",
+        "kind": _KIND_STATEFUL,
+        "arguments": _EMPTY,
     }
 
     return "%s()" % py_name, [stateful]
@@ -1277,18 +1432,12 @@ def add_n_delay(identifier, delay_input, delay_time, initial_value, order,
     py_name = "_delayn_%s" % identifier
 
     if len(subs) == 0:
-        stateful_py_expr = (
-            "DelayN(lambda: %s, lambda: %s,"
-            "lambda: %s, lambda: %s, time_step, '%s')"
-            % (delay_input, delay_time, initial_value, order, py_name)
-        )
+        stateful_py_expr = _delay_n_template % (
+            delay_input, delay_time, initial_value, order, py_name)
 
     else:
-        stateful_py_expr = (
-            "DelayN(_delayn_input_%s, lambda: %s,"
-            " _delayn_init_%s, lambda: %s, time_step, '%s')"
-            % (identifier, delay_time, identifier, order, py_name)
-        )
+        stateful_py_expr = _delay_n_subs_template % (
+            identifier, delay_time, identifier, order, py_name)
 
         # following elements not specified in the model file, but must exist
         # create the delay initialization element
@@ -1303,9 +1452,9 @@ def add_n_delay(identifier, delay_input, delay_time, initial_value, order,
             "doc": "Provides initial conditions for %s function" \
                     % identifier,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
-            "arguments": "",
+            "lims": _NONE,
+            "eqn": _NONE,
+            "arguments": _EMPTY,
         })
 
         new_structure.append({
@@ -1317,10 +1466,10 @@ def add_n_delay(identifier, delay_input, delay_time, initial_value, order,
             "subs": subs,
             "merge_subs": merge_subs,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
+            "lims": _NONE,
+            "eqn": _NONE,
             "py_expr": delay_input,
-            "arguments": "",
+            "arguments": _EMPTY,
         })
 
     # describe the stateful object
@@ -1332,14 +1481,14 @@ def add_n_delay(identifier, delay_input, delay_time, initial_value, order,
                 %s"
         % (delay_time, initial_value, order),
         "py_expr": stateful_py_expr,
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
-        "arguments": "",
+        "kind": _KIND_STATEFUL,
+        "arguments": _EMPTY,
     })
 
     return "%s()" % py_name, new_structure
@@ -1398,17 +1547,13 @@ def add_forecast(identifier, forecast_input, average_time, horizon,
     py_name = "_forecast_%s" % identifier
 
     if len(subs) == 0:
-        stateful_py_expr = "Forecast(lambda: %s, lambda: %s,"\
-                           " lambda: %s, '%s')" % (
-                               forecast_input, average_time,
-                               horizon, py_name)
+        stateful_py_expr = _forecast_template % (
+            forecast_input, average_time, horizon, py_name)
 
     else:
         # only need to re-dimension init as xarray will take care of other
-        stateful_py_expr = "Forecast(_forecast_input_%s, lambda: %s,"\
-                           " lambda: %s, '%s')" % (
-                               identifier, average_time,
-                               horizon, py_name)
+        stateful_py_expr = _forecast_subs_template % (
+            identifier, average_time, horizon, py_name)
 
         # following elements not specified in the model file, but must exist
         # create the delay initialization element
@@ -1423,9 +1568,9 @@ def add_forecast(identifier, forecast_input, average_time, horizon,
             "doc": "Provides input for %s function"
                     % identifier,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
-            "arguments": "",
+            "lims": _NONE,
+            "eqn": _NONE,
+            "arguments": _EMPTY,
         })
 
     new_structure.append({
@@ -1435,14 +1580,14 @@ def add_forecast(identifier, forecast_input, average_time, horizon,
         "doc": "Forecast average time: %s \n Horizon %s"
         % (average_time, horizon),
         "py_expr": stateful_py_expr,
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
-        "arguments": "",
+        "kind": _KIND_STATEFUL,
+        "arguments": _EMPTY,
     })
 
     return "%s()" % py_name, new_structure
@@ -1504,14 +1649,12 @@ def add_sample_if_true(identifier, condition, actual_value, initial_value,
     py_name = "_sample_if_true_%s" % identifier
 
     if len(subs) == 0:
-        stateful_py_expr = "SampleIfTrue(lambda: %s, lambda: %s,"\
-                           "lambda: %s, '%s')" % (
-                               condition, actual_value, initial_value, py_name)
+        stateful_py_expr = _sample_if_true_template % (
+            condition, actual_value, initial_value, py_name)
 
     else:
-        stateful_py_expr = "SampleIfTrue(lambda: %s, lambda: %s,"\
-                           "_sample_if_true_init_%s, '%s')" % (
-                               condition, actual_value, identifier, py_name)
+        stateful_py_expr = _sample_if_true_subs_template % (
+            condition, actual_value, identifier, py_name)
 
         # following elements not specified in the model file, but must exist
         # create the delay initialization element
@@ -1525,8 +1668,8 @@ def add_sample_if_true(identifier, condition, actual_value, initial_value,
             "merge_subs": merge_subs,
             "doc": "Provides initial conditions for %s function" % identifier,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
+            "lims": _NONE,
+            "eqn": _NONE,
             "arguments": ""
         })
     # describe the stateful object
@@ -1537,13 +1680,13 @@ def add_sample_if_true(identifier, condition, actual_value, initial_value,
         "doc": "Initial value: %s \n  Input: %s \n Condition: %s" % (
             initial_value, actual_value, condition),
         "py_expr": stateful_py_expr,
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
+        "kind": _KIND_STATEFUL,
         "arguments": ""
     })
 
@@ -1613,20 +1756,14 @@ def add_n_smooth(identifier, smooth_input, smooth_time, initial_value, order,
     py_name = "_smooth_%s" % identifier
 
     if len(subs) == 0:
-        stateful_py_expr = (
-            "Smooth(lambda: %s, lambda: %s,"
-            "lambda: %s, lambda: %s, '%s')"
-            % (smooth_input, smooth_time, initial_value, order, py_name)
-        )
+        stateful_py_expr = _smooth_template % (
+            smooth_input, smooth_time, initial_value, order, py_name)
 
     else:
         # only need to re-dimension init and input as xarray will take care of
         # other
-        stateful_py_expr = (
-            "Smooth(_smooth_input_%s, lambda: %s,"
-            " _smooth_init_%s, lambda: %s, '%s')"
-            % (identifier, smooth_time, identifier, order, py_name)
-        )
+        stateful_py_expr = _smooth_subs_template % (
+            identifier, smooth_time, identifier, order, py_name)
 
         # following elements not specified in the model file, but must exist
         # create the delay initialization element
@@ -1641,9 +1778,9 @@ def add_n_smooth(identifier, smooth_input, smooth_time, initial_value, order,
             "doc": "Provides initial conditions for %s function" % \
                     identifier,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
-            "arguments": "",
+            "lims": _NONE,
+            "eqn": _NONE,
+            "arguments": _EMPTY,
         })
 
         new_structure.append({
@@ -1655,10 +1792,10 @@ def add_n_smooth(identifier, smooth_input, smooth_time, initial_value, order,
             "subs": subs,
             "merge_subs": merge_subs,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
+            "lims": _NONE,
+            "eqn": _NONE,
             "py_expr": smooth_input,
-            "arguments": "",
+            "arguments": _EMPTY,
         })
 
     new_structure.append({
@@ -1668,14 +1805,14 @@ def add_n_smooth(identifier, smooth_input, smooth_time, initial_value, order,
         "doc": "Smooth time %s \n Initial value %s \n Smooth order %s" % (
             smooth_time, initial_value, order),
         "py_expr": stateful_py_expr,
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
-        "arguments": "",
+        "kind": _KIND_STATEFUL,
+        "arguments": _EMPTY,
     })
 
     return "%s()" % py_name, new_structure
@@ -1734,17 +1871,13 @@ def add_n_trend(identifier, trend_input, average_time, initial_trend,
     py_name = "_trend_%s" % identifier
 
     if len(subs) == 0:
-        stateful_py_expr = "Trend(lambda: %s, lambda: %s,"\
-                           " lambda: %s, '%s')" % (
-                               trend_input, average_time,
-                               initial_trend, py_name)
+        stateful_py_expr = _trend_template % (
+            trend_input, average_time, initial_trend, py_name)
 
     else:
         # only need to re-dimension init as xarray will take care of other
-        stateful_py_expr = "Trend(lambda: %s, lambda: %s,"\
-                           " _trend_init_%s, '%s')" % (
-                               trend_input, average_time,
-                               identifier, py_name)
+        stateful_py_expr = _trend_subs_template % (
+            trend_input, average_time, identifier, py_name)
 
         # following elements not specified in the model file, but must exist
         # create the delay initialization element
@@ -1759,9 +1892,9 @@ def add_n_trend(identifier, trend_input, average_time, initial_trend,
             "doc": "Provides initial conditions for %s function"
                     % identifier,
             "unit": "See docs for %s" % identifier,
-            "lims": "None",
-            "eqn": "None",
-            "arguments": "",
+            "lims": _NONE,
+            "eqn": _NONE,
+            "arguments": _EMPTY,
         })
 
     new_structure.append({
@@ -1771,14 +1904,14 @@ def add_n_trend(identifier, trend_input, average_time, initial_trend,
         "doc": "Trend average time: %s \n Trend initial value %s"
         % (average_time, initial_trend),
         "py_expr": stateful_py_expr,
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
-        "arguments": "",
+        "kind": _KIND_STATEFUL,
+        "arguments": _EMPTY,
     })
 
     return "%s()" % py_name, new_structure
@@ -1825,15 +1958,15 @@ def add_initial(identifier, value, deps):
         "parent_name": identifier,
         "real_name": "Initial %s" % identifier,
         "doc": "Returns the value taken on during the initialization phase",
-        "py_expr": "Initial(lambda: %s, '%s')" % (value, py_name),
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        "py_expr": _initial_template % (value, py_name),
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
-        "arguments": "",
+        "kind": _KIND_STATEFUL,
+        "arguments": _EMPTY,
     }
 
     return "%s()" % stateful["py_name"], [stateful]
@@ -1894,13 +2027,13 @@ def add_tab_data(identifier, real_name, subs,
         "doc": "Provides data for data variable %s" % identifier,
         "py_expr": "TabData('%s', '%s', %s, %s)" % (
             real_name, identifier, coords, keyword),
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
         "subs": subs,
         "merge_subs": merge_subs,
         "kind": "tab_data",
-        "arguments": "",
+        "arguments": _EMPTY,
     }
 
     return "%s(time())" % data["py_name"], [data]
@@ -1970,14 +2103,14 @@ def add_ext_data(identifier, file_name, tab, time_row_or_col, cell, subs,
         # This object name will not be used in the model as
         # the information is added to the existing object
         # with add method.
-        kind = "external_add"
+        kind = _KIND_EXTERNAL_ADD
         name = utils.make_add_identifier(name, build_names)
         py_expr = ".add(%s, %s, %s, %s, %s, %s)"
     else:
         # Regular name will be used and a new object will be created
         # in the model file.
         build_names.add(name)
-        kind = "external"
+        kind = _KIND_EXTERNAL
         py_expr = "ExtData(%s, %s, %s, %s, %s, %s,\n"\
                   "        _root, '{}')".format(name)
 
@@ -1988,13 +2121,13 @@ def add_ext_data(identifier, file_name, tab, time_row_or_col, cell, subs,
         "doc": "Provides data for data variable %s" % identifier,
         "py_expr": py_expr % (file_name, tab, time_row_or_col, cell, keyword,
                               coords),
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
         "subs": subs,
         "merge_subs": merge_subs,
         "kind": kind,
-        "arguments": "",
+        "arguments": _EMPTY,
     }
 
     return "%s(time())" % external["py_name"], [external]
@@ -2055,13 +2188,13 @@ def add_ext_constant(identifier, file_name, tab, cell,
         # This object name will not be used in the model as
         # the information is added to the existing object
         # with add method.
-        kind = "external_add"
+        kind = _KIND_EXTERNAL_ADD
         name = utils.make_add_identifier(name, build_names)
         py_expr = ".add(%s, %s, %s, %s)"
     else:
         # Regular name will be used and a new object will be created
         # in the model file.
-        kind = "external"
+        kind = _KIND_EXTERNAL
         py_expr = "ExtConstant(%s, %s, %s, %s,\n"\
                   "            _root, '{}')".format(name)
     build_names.add(name)
@@ -2072,13 +2205,13 @@ def add_ext_constant(identifier, file_name, tab, cell,
         "real_name": "External constant for %s" % identifier,
         "doc": "Provides data for constant data variable %s" % identifier,
         "py_expr": py_expr % (file_name, tab, cell, coords),
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
         "subs": subs,
         "merge_subs": merge_subs,
         "kind": kind,
-        "arguments": "",
+        "arguments": _EMPTY,
     }
 
     return "%s()" % external["py_name"], [external]
@@ -2142,15 +2275,16 @@ def add_ext_lookup(identifier, file_name, tab, x_row_or_col, cell,
         # This object name will not be used in the model as
         # the information is added to the existing object
         # with add method.
-        kind = "external_add"
+        kind = _KIND_EXTERNAL_ADD
         name = utils.make_add_identifier(name, build_names)
-        py_expr = ".add(%s, %s, %s, %s, %s)"
+        py_expr = _ext_lookup_add_template % (
+            file_name, tab, x_row_or_col, cell, coords)
     else:
         # Regular name will be used and a new object will be created
         # in the model file.
-        kind = "external"
-        py_expr = "ExtLookup(%s, %s, %s, %s, %s,\n"\
-                  "          _root, '{}')".format(name)
+        kind = _KIND_EXTERNAL
+        py_expr = f"ExtLookup({file_name}, {tab}, {x_row_or_col}, {cell},"\
+                  f" {coords},\n          _root, '{name}')"
     build_names.add(name)
 
     external = {
@@ -2158,10 +2292,10 @@ def add_ext_lookup(identifier, file_name, tab, x_row_or_col, cell,
         "parent_name": identifier,
         "real_name": "External lookup data for %s" % identifier,
         "doc": "Provides data for external lookup variable %s" % identifier,
-        "py_expr": py_expr % (file_name, tab, x_row_or_col, cell, coords),
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
+        "py_expr": py_expr,
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
         "subs": subs,
         "merge_subs": merge_subs,
         "kind": kind,
@@ -2210,26 +2344,27 @@ def add_macro(identifier, macro_name, filename, arg_names, arg_vals, deps):
 
     py_name = "_macro_" + macro_name + "_" + identifier
 
+    # generator fed directly to join, no intermediate list
     func_args = "{ %s }" % ", ".join(
-        ["'%s': lambda: %s" % (key, val) for key, val in zip(arg_names,
-                                                             arg_vals)])
+        f"'{key}': lambda: {val}" for key, val in zip(arg_names, arg_vals))
 
     stateful = {
         "py_name": py_name,
         "parent_name": identifier,
         "real_name": "Macro Instantiation of " + macro_name,
         "doc": "Instantiates the Macro",
-        "py_expr": "Macro(_root.joinpath('%s'), %s, '%s',"
+        "py_expr": f"Macro(_root.joinpath('{filename}'), {func_args},"
+        f" '{macro_name}',"
         " time_initialization=lambda: __data['time'],"
-        " py_name='%s')" % (filename, func_args, macro_name, py_name),
-        "unit": "None",
-        "lims": "None",
-        "eqn": "None",
-        "subs": "",
+        f" py_name='{py_name}')",
+        "unit": _NONE,
+        "lims": _NONE,
+        "eqn": _NONE,
+        "subs": _EMPTY,
         "merge_subs": None,
         "dependencies": deps,
-        "kind": "stateful",
-        "arguments": "",
+        "kind": _KIND_STATEFUL,
+        "arguments": _EMPTY,
     }
 
     return "%s()" % stateful["py_name"], [stateful]
@@ -2258,12 +2393,35 @@ def add_incomplete(var_name, dependencies):
     """
     Imports.add("functions", "incomplete")
 
-    warnings.warn(
-        "%s has no equation specified" % var_name, SyntaxWarning, stacklevel=2
-    )
+    # warning is deferred and aggregated by flush_incomplete_warnings,
+    # warnings.warn walks the frame stack and is expensive per variable
+    _incomplete_pending.append(var_name)
 
     # first arg is `self` reference
-    return "incomplete(%s)" % ", ".join(dependencies), []
+    return f"incomplete({', '.join(dependencies)})", []
+
+
+# names of incomplete variables waiting for an aggregated warning
+_incomplete_pending = []
+
+
+def flush_incomplete_warnings():
+    """
+    Emit a single aggregated warning for all the incomplete variables
+    collected by add_incomplete since the last flush.
+
+    Returns
+    -------
+    None
+
+    """
+    if _incomplete_pending:
+        warnings.warn(
+            "The following variables have no equation specified: "
+            + ", ".join(_incomplete_pending),
+            SyntaxWarning, stacklevel=2
+        )
+        _incomplete_pending.clear()
 
 
 def build_dependencies(deps, exps):
@@ -2327,8 +2485,10 @@ def build_function_call(function_def, user_arguments, dependencies=set()):
         Function call.
 
     """
-    if isinstance(function_def, str):
-        return function_def + "(" + ",".join(user_arguments) + ")"
+    # exact type check: function definitions are plain str or dict, and
+    # type() is faster than isinstance() on this hot path
+    if type(function_def) is str:
+        return f"{function_def}({','.join(user_arguments)})"
 
     if function_def["name"] == "not_implemented_function":
         user_arguments = ["'" + function_def["original_name"] + "'"] + \
@@ -2349,48 +2509,111 @@ def build_function_call(function_def, user_arguments, dependencies=set()):
             Imports.add(function_def["module"], function_def["name"])
 
     if "parameters" in function_def:
-        parameters = function_def["parameters"]
-        user_argument = ""
-        arguments = []
+        cached = _function_call_cache.get(id(function_def))
+        if cached is None or cached[0] is not function_def:
+            # compile the parameter dispatch once per function_def; the
+            # cache keeps a reference to the definition so its id cannot
+            # be reused by another dict while the entry is alive
+            cached = (function_def, _compile_function_call(function_def))
+            _function_call_cache[id(function_def)] = cached
+
+        return cached[1](user_arguments, dependencies)
+
+    return f"{function_def['name']}({','.join(user_arguments)})"
+
+
+# compiled argument-building closures by id of the function definition
+_function_call_cache = {}
+
+# parameter types resolved to small ints when a function_def is compiled,
+# so build_call dispatches on integer compares instead of string hashing
+_PT_EXPRESSION, _PT_LAMBDA, _PT_TIME, _PT_SCOPE, _PT_PREDEF,\
+    _PT_SUBS_RANGE_TO_LIST, _PT_IGNORE = range(7)
+
+_parameter_types = {
+    "expression": _PT_EXPRESSION,
+    "lambda": _PT_LAMBDA,
+    "time": _PT_TIME,
+    "scope": _PT_SCOPE,
+    "predef": _PT_PREDEF,
+    "subs_range_to_list": _PT_SUBS_RANGE_TO_LIST,
+    "ignore": _PT_IGNORE,
+}
+
+
+def _compile_function_call(function_def):
+    """
+    Precompile the parameter dispatch of a function definition.
+
+    The parameter types and optionality of a function_def never change,
+    so they are resolved once here instead of re-checking the parameter
+    dicts for every translated call site.
+
+    Parameters
+    ----------
+    function_def: dict
+        Function definition map, see build_function_call.
+
+    Returns
+    -------
+    callable
+        Closure mapping (user_arguments, dependencies) to the function
+        call string.
+
+    """
+    name = function_def["name"]
+    # the dict lookup raises KeyError on unknown parameter types here,
+    # once per definition, instead of on every translated call
+    slots = [(
+        _parameter_types[parameter_def.get("type", "expression")],
+        parameter_def.get("optional", False),
+        parameter_def["name"]
+    ) for parameter_def in function_def["parameters"]]
+
+    n_slots = len(slots)
+
+    def build_call(user_arguments, dependencies):
+        # preallocate for the common case where every slot emits an
+        # argument, truncating once at the end if some did not
+        arguments = [None] * n_slots
+        out_idx = 0
         argument_idx = 0
-        for parameter_idx in range(len(parameters)):
-            parameter_def = parameters[parameter_idx]
-            is_optional = (
-                parameter_def["optional"] if "optional" in parameter_def else
-                False
-            )
+        for parameter_type, is_optional, parameter_name in slots:
             if argument_idx >= len(user_arguments) and is_optional:
                 break
 
-            parameter_type = (
-                parameter_def["type"] if "type" in parameter_def else
-                "expression")
-
-            if parameter_type in ["expression",
-                                  "lambda",
-                                  "subs_range_to_list"]:
-                user_argument = user_arguments[argument_idx]
+            if parameter_type == _PT_EXPRESSION:
+                arguments[out_idx] = user_arguments[argument_idx]
+                out_idx += 1
+                argument_idx += 1
+            elif parameter_type == _PT_LAMBDA:
+                arguments[out_idx] = "lambda: " + user_arguments[argument_idx]
+                out_idx += 1
                 argument_idx += 1
-            elif parameter_type == "time":
+            elif parameter_type == _PT_TIME:
                 if "time" in dependencies:
                     dependencies["time"] += 1
                 else:
                     dependencies["time"] = 1
-            elif parameter_type == "ignore":
+                arguments[out_idx] = "__data['time']"
+                out_idx += 1
+            elif parameter_type == _PT_SCOPE:
+                arguments[out_idx] = "__data['scope']"
+                out_idx += 1
+            elif parameter_type == _PT_PREDEF:
+                arguments[out_idx] = parameter_name
+                out_idx += 1
+            elif parameter_type == _PT_SUBS_RANGE_TO_LIST:
+                arguments[out_idx] =\
+                    f"_subscript_dict['{user_arguments[argument_idx]}']"
+                out_idx += 1
                 argument_idx += 1
-                continue
-
-            arguments.append(
-                {
-                    "expression": user_argument,
-                    "lambda": "lambda: " + user_argument,
-                    "time": "__data['time']",
-                    "scope": "__data['scope']",
-                    "predef": parameter_def["name"],
-                    "subs_range_to_list": f"_subscript_dict['{user_argument}']"
-                }[parameter_type]
-            )
+            else:  # _PT_IGNORE
+                argument_idx += 1
+
+        if out_idx != n_slots:
+            del arguments[out_idx:]
 
-        return function_def["name"] + "(" + ", ".join(arguments) + ")"
+        return name + "(" + ", ".join(arguments) + ")"
 
-    return function_def["name"] + "(" + ",".join(user_arguments) + ")"
+    return build_call
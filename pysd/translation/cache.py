@@ -0,0 +1,89 @@
+"""
+Persistent cache of translated model files.
+
+The generated Python source is stored on disk keyed by the hash of the
+original model source together with the PySD and Python versions, so
+re-translating an unchanged model can skip the whole parsing and
+building pipeline. Caching is best effort: any failure to read or write
+the cache behaves like a miss.
+"""
+
+import sys
+import hashlib
+from pathlib import Path
+
+from pysd._version import __version__
+
+
+def _cache_dir():
+    """
+    Return the directory where cached translations are stored.
+    """
+    return Path.home().joinpath(".cache", "pysd", "translation-cache")
+
+
+def _cache_file(source):
+    """
+    Return the cache file path for a model source.
+
+    Parameters
+    ----------
+    source: bytes
+        Content of the original model file.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the cache entry for the given source.
+
+    """
+    key = hashlib.sha256(source)
+    key.update(__version__.encode())
+    key.update(sys.version.encode())
+    return _cache_dir().joinpath(key.hexdigest() + ".py")
+
+
+def get(source):
+    """
+    Return the generated model text cached for a model source.
+
+    Parameters
+    ----------
+    source: bytes
+        Content of the original model file.
+
+    Returns
+    -------
+    str or None
+        The cached generated model text, or None on a cache miss.
+
+    """
+    try:
+        return _cache_file(source).read_text(encoding="UTF-8")
+    except OSError:
+        return None
+
+
+def put(source, generated):
+    """
+    Store the generated model text for a model source.
+
+    Parameters
+    ----------
+    source: bytes
+        Content of the original model file.
+
+    generated: str
+        Text of the generated model file.
+
+    Returns
+    -------
+    None
+
+    """
+    try:
+        cache_file = _cache_file(source)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(generated, encoding="UTF-8")
+    except OSError:
+        pass
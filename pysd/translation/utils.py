@@ -6,6 +6,8 @@ functions.py
 
 import warnings
 from collections.abc import Mapping
+from functools import lru_cache
+from sys import intern
 
 import regex as re
 import numpy as np
@@ -67,10 +69,31 @@ def find_subscript_name(subscript_dict, element, avoid=[]):
     ...                      avoid=['Dim1'])
     'Dim2'
     """
-    if element in subscript_dict.keys():
-        return element
+    return _find_subscript_name_cached(
+        _freeze_subscript_dict(subscript_dict), element, tuple(avoid))
 
-    for name, elements in subscript_dict.items():
+
+def _freeze_subscript_dict(subscript_dict):
+    """
+    Return a hashable copy of subscript_dict to key the cached lookups,
+    as the dictionary may be mutated during the translation.
+    """
+    return tuple(
+        (name, tuple(elements))
+        for name, elements in subscript_dict.items())
+
+
+@lru_cache(maxsize=None)
+def _find_subscript_name_cached(frozen_subscript_dict, element, avoid):
+    """
+    Cached version of find_subscript_name working on the frozen
+    subscript dictionary.
+    """
+    for name, _ in frozen_subscript_dict:
+        if element == name:
+            return element
+
+    for name, elements in frozen_subscript_dict:
         if element in elements and name not in avoid:
             return name
 
@@ -111,11 +134,24 @@ def make_coord_dict(subs, subscript_dict, terse=True):
     {'Dim2': ['D'], 'Dim1': ['A', 'B', 'C']}
 
     """
-    sub_elems_list = [y for x in subscript_dict.values() for y in x]
+    return dict(_make_coord_dict_cached(
+        tuple(subs), _freeze_subscript_dict(subscript_dict), terse))
+
+
+@lru_cache(maxsize=None)
+def _make_coord_dict_cached(subs, frozen_subscript_dict, terse):
+    """
+    Cached version of make_coord_dict working on the frozen
+    subscript dictionary.
+    """
+    subscript_dict = {
+        name: list(elements) for name, elements in frozen_subscript_dict}
+    sub_elems_set = {y for x in subscript_dict.values() for y in x}
     coordinates = {}
     for sub in subs:
-        if sub in sub_elems_list:
-            name = find_subscript_name(subscript_dict, sub, avoid=subs)
+        if sub in sub_elems_set:
+            name = _find_subscript_name_cached(
+                frozen_subscript_dict, sub, subs)
             coordinates[name] = [sub]
         elif not terse:
             coordinates[sub] = subscript_dict[sub]
@@ -340,11 +376,37 @@ def make_python_identifier(string, namespace=None):
         identifier = s + '_' + str(i)
         i += 1
 
+    # identifiers are reused as dict keys all over the builder, intern
+    # them so those lookups compare by pointer
+    identifier = intern(identifier)
+
     namespace[string] = identifier
 
     return identifier
 
 
+@lru_cache(maxsize=None)
+def make_python_identifier_cached(string):
+    """
+    Cached version of make_python_identifier for calls without a
+    namespace. Without a namespace the identifier only depends on the
+    input string, so repeated sanitizations of the same name (e.g. one
+    per macro call) collapse to a cache lookup.
+
+    Parameters
+    ----------
+    string: str
+        The text to be converted into a valid python identifier.
+
+    Returns
+    -------
+    identifier: str
+        A vaild python identifier based on the input string.
+
+    """
+    return make_python_identifier(string)
+
+
 def make_add_identifier(identifier, build_names):
     """
     Takes an existing used Python identifier and attatch a unique
@@ -369,19 +431,37 @@ def make_add_identifier(identifier, build_names):
       and the existing ones.
 
     """
-    identifier += "ADD_"
-    number = 1
-    # iterate until finding a non-used identifier
-    while identifier + str(number) in build_names:
+    cached = _add_identifier_counters.get(id(build_names))
+    if cached is None or cached[0] is not build_names:
+        cached = (build_names, {})
+        _add_identifier_counters[id(build_names)] = cached
+    counters = cached[1]
+
+    number = counters.get(identifier, 0)
+    base = identifier + "ADD_"
+    if number and base + str(number) not in build_names:
+        # build_names has been cleared since the last call, restart numbering
+        number = 0
+    number += 1
+
+    # probe upward in case suffixed names were added externally
+    new_identifier = base + str(number)
+    while new_identifier in build_names:
         number += 1
+        new_identifier = base + str(number)
 
-    # update identifier
-    identifier += str(number)
+    counters[identifier] = number
 
     # update the build names
-    build_names.add(identifier)
+    build_names.add(new_identifier)
 
-    return identifier
+    return new_identifier
+
+
+# per-set counters with the last ADD_# used for each identifier, so the
+# next suffix is found without linearly probing build_names. Keyed by
+# id() with a strong reference to the set to guard against id reuse.
+_add_identifier_counters = {}
 
 
 def simplify_subscript_input(coords, subscript_dict, return_full, merge_subs):
@@ -16,7 +16,7 @@ from parsimonious.exceptions import IncompleteParseError,\
                                     VisitationError,\
                                     ParseError
 
-from .. import builder, utils
+from .. import builder, cache, utils
 from ...py_backend.external import ExtSubscript
 from ...py_backend.utils import compute_shape
 
@@ -1488,7 +1488,7 @@ def parse_general_expression(element, namespace={}, subscript_dict={},
             call = vc[0]
             arglist = vc[4]
             self.kind = "component"
-            py_name = utils.make_python_identifier(call)
+            py_name = utils.make_python_identifier_cached(call)
             macro = [x for x in macro_list if x["py_name"] == py_name][
                 0
             ]  # should match once
@@ -1732,6 +1732,9 @@ def translate_section(section, macro_list, sketch, root_path, subview_sep=""):
         if element["dependencies"] is not None
     }
 
+    # warn once about all the incomplete equations of the section
+    builder.flush_incomplete_warnings()
+
     # macros are built in their own separate files, and their inputs and
     # outputs are put in views/subviews
     if sketch and (section["name"] == "_main_"):
@@ -1899,6 +1902,11 @@ def translate_vensim(mdl_file, split_views, encoding=None, **kwargs):
 
     **kwargs: (optional)
         Additional parameters passed to the translate_vensim function
+        use_cache: bool
+            If True, reuse the generated model file cached from a
+            previous translation of an identical model source, skipping
+            the translation. Only available for models without macros
+            and with split_views=False. Default is False.
 
     Returns
     -------
@@ -1913,6 +1921,9 @@ def translate_vensim(mdl_file, split_views, encoding=None, **kwargs):
     # character used to place subviews in the parent view folder
     subview_sep = kwargs.get("subview_sep", "")
 
+    # reuse the generated file of a previous identical translation
+    use_cache = kwargs.get("use_cache", False) and not split_views
+
     if isinstance(mdl_file, str):
         mdl_file = pathlib.Path(mdl_file)
 
@@ -1934,6 +1945,14 @@ def translate_vensim(mdl_file, split_views, encoding=None, **kwargs):
 
     outfile_name = mdl_file.with_suffix(".py")
 
+    if use_cache:
+        # entries are only stored for macro-free models built in a
+        # single file, so a hit can be written back directly
+        cached = cache.get(text.encode("UTF-8"))
+        if cached is not None:
+            outfile_name.write_text(cached, encoding="UTF-8")
+            return outfile_name
+
     if split_views:
         text, sketch = _split_sketch(text)
     else:
@@ -1955,6 +1974,12 @@ def translate_vensim(mdl_file, split_views, encoding=None, **kwargs):
     for section in file_sections:
         translate_section(section, macro_list, sketch, root_path, subview_sep)
 
+    if use_cache and not macro_list:
+        # models with macros generate several files and cannot be
+        # restored from a single cached entry
+        cache.put(text.encode("UTF-8"),
+                  outfile_name.read_text(encoding="UTF-8"))
+
     return outfile_name
 
 
@@ -1,44 +1,53 @@
 import os
 from unittest import TestCase
+from warnings import catch_warnings
+
+import pandas as pd
+
+from pysd.tools.benchmarking import runner, load_outputs, assert_frames_close
 
 # most of the features of this script are already tested indirectly when
 # running vensim and xmile integration tests
 
 _root = os.path.dirname(__file__)
 
+# paths used by the tests, joined once at import
+_teacup_file = os.path.join(_root, "data/out_teacup.csv")
+_teacup_mod_file = os.path.join(_root, "data/out_teacup_modified.csv")
+_not_existent_file = os.path.join(_root, "more-tests/not_existent.mdl")
+_not_vensim_file = os.path.join(
+    _root, "more-tests/not_vensim/test_not_vensim.txt")
+
 
 class TestErrors(TestCase):
 
-    def test_canonical_file_not_found(self):
-        from pysd.tools.benchmarking import runner
+    @classmethod
+    def setUpClass(cls):
+        # load the canonical outputs only once, tests consume copies
+        cls.teacup = load_outputs(_teacup_file)
+        cls.teacup_mod = load_outputs(_teacup_mod_file)
 
+    def test_canonical_file_not_found(self):
         with self.assertRaises(FileNotFoundError) as err:
-            runner(os.path.join(_root, "more-tests/not_existent.mdl"))
+            runner(_not_existent_file)
 
         self.assertIn(
             'Canonical output file not found.',
             str(err.exception))
 
     def test_non_valid_model(self):
-        from pysd.tools.benchmarking import runner
-
         with self.assertRaises(ValueError) as err:
-            runner(os.path.join(
-                _root,
-                "more-tests/not_vensim/test_not_vensim.txt"))
+            runner(_not_vensim_file)
 
         self.assertIn(
             'Modelfile should be *.mdl or *.xmile',
             str(err.exception))
 
     def test_different_frames_error(self):
-        from pysd.tools.benchmarking import load_outputs, assert_frames_close
-
         with self.assertRaises(AssertionError) as err:
             assert_frames_close(
-                load_outputs(os.path.join(_root, "data/out_teacup.csv")),
-                load_outputs(
-                    os.path.join(_root, "data/out_teacup_modified.csv")))
+                self.teacup.copy(),
+                self.teacup_mod.copy())
 
         self.assertIn(
             "Following columns are not close:\n\tTeacup Temperature",
@@ -58,9 +67,8 @@ class TestErrors(TestCase):
 
         with self.assertRaises(AssertionError) as err:
             assert_frames_close(
-                load_outputs(os.path.join(_root, "data/out_teacup.csv")),
-                load_outputs(
-                    os.path.join(_root, "data/out_teacup_modified.csv")),
+                self.teacup.copy(),
+                self.teacup_mod.copy(),
                 verbose=True)
 
         self.assertIn(
@@ -80,14 +88,10 @@ class TestErrors(TestCase):
             str(err.exception))
 
     def test_different_frames_warning(self):
-        from warnings import catch_warnings
-        from pysd.tools.benchmarking import load_outputs, assert_frames_close
-
         with catch_warnings(record=True) as ws:
             assert_frames_close(
-                load_outputs(os.path.join(_root, "data/out_teacup.csv")),
-                load_outputs(
-                    os.path.join(_root, "data/out_teacup_modified.csv")),
+                self.teacup.copy(),
+                self.teacup_mod.copy(),
                 assertion="warn")
 
             # use only user warnings
@@ -110,11 +114,12 @@ class TestErrors(TestCase):
                 "Expected values:\n\t",
                 str(wu[0].message))
 
-        with catch_warnings(record=True) as ws:
+            # reset the record buffer instead of re-entering the context
+            del ws[:]
+
             assert_frames_close(
-                load_outputs(os.path.join(_root, "data/out_teacup.csv")),
-                load_outputs(
-                    os.path.join(_root, "data/out_teacup_modified.csv")),
+                self.teacup.copy(),
+                self.teacup_mod.copy(),
                 assertion="warn", verbose=True)
 
             # use only user warnings
@@ -138,10 +143,6 @@ class TestErrors(TestCase):
                 str(wu[0].message))
 
     def test_different_cols(self):
-        from warnings import catch_warnings
-        from pysd.tools.benchmarking import assert_frames_close
-        import pandas as pd
-
         d1 = pd.DataFrame({'a': [1, 2], 'b': [3, 4], 'd': [6, 7]})
         d2 = pd.DataFrame({'a': [1, 2]})
         d3 = pd.DataFrame({'a': [1, 2], 'c': [3, 4]})
@@ -171,7 +172,9 @@ class TestErrors(TestCase):
                 "from actual values not found in expected values.",
                 str(wu[0].message))
 
-        with catch_warnings(record=True) as ws:
+            # reset the record buffer instead of re-entering the context
+            del ws[:]
+
             assert_frames_close(
                 expected=d1,
                 actual=d2,
@@ -187,7 +190,8 @@ class TestErrors(TestCase):
                 "from expected values not found in actual values.",
                 str(wu[0].message))
 
-        with catch_warnings(record=True) as ws:
+            del ws[:]
+
             assert_frames_close(
                 actual=d1,
                 expected=d3,
@@ -208,8 +212,6 @@ class TestErrors(TestCase):
                 "values.", str(wu[0].message))
 
     def test_invalid_input(self):
-        from pysd.tools.benchmarking import assert_frames_close
-
         with self.assertRaises(TypeError) as err:
             assert_frames_close(
                 actual=[1, 2],
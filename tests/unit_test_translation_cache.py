@@ -0,0 +1,36 @@
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from pysd.translation import cache
+
+
+class TestTranslationCache(TestCase):
+
+    def setUp(self):
+        # redirect the cache to a temporary directory
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self._original_cache_dir = cache._cache_dir
+        cache._cache_dir = lambda: self.tmp_dir
+
+    def tearDown(self):
+        cache._cache_dir = self._original_cache_dir
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_miss_returns_none(self):
+        self.assertIsNone(cache.get(b"some model source"))
+
+    def test_roundtrip(self):
+        cache.put(b"some model source", "generated text")
+
+        self.assertEqual(cache.get(b"some model source"), "generated text")
+        self.assertIsNone(cache.get(b"other model source"))
+
+    def test_entries_by_source(self):
+        cache.put(b"some model source", "generated text")
+        cache.put(b"other model source", "other generated text")
+
+        self.assertEqual(cache.get(b"some model source"), "generated text")
+        self.assertEqual(
+            cache.get(b"other model source"), "other generated text")
@@ -1077,6 +1077,7 @@ class TestParse_general_expression(unittest.TestCase):
             res[0]["py_expr"], )
 
     def test_incomplete_expression(self):
+        from pysd.translation import builder
         from pysd.translation.vensim.vensim2py import parse_general_expression
         from warnings import catch_warnings
 
@@ -1097,10 +1098,13 @@ class TestParse_general_expression(unittest.TestCase):
                     "Var B": "var_b",
                 }
             )
+            # incomplete warnings are aggregated and emitted on flush
+            self.assertEqual(len(w), 0)
+            builder.flush_incomplete_warnings()
             self.assertEqual(len(w), 1)
             self.assertTrue(
-                "Incomplete Func has no equation specified" in
-                str(w[-1].message)
+                "The following variables have no equation specified: "
+                "Incomplete Func" in str(w[-1].message)
             )
 
         self.assertEqual(res[0]["py_expr"],